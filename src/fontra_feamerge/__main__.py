@@ -0,0 +1,38 @@
+"""
+Command line entry point for the standalone group expansion scripts:
+
+    python -m fontra_feamerge break-kerning path/to/font.ufo [input_fea_file] [output_fea_file]
+    python -m fontra_feamerge break-mark path/to/font.ufo [input_fea_file] [output_fea_file]
+"""
+
+import sys
+
+from .break_groups_in_fea import break_groups_in_fea
+from .break_groups_in_mark_pos import expand_mark_positioning_groups
+
+# Command name: (function, default output file)
+COMMANDS = {
+    "break-kerning": (break_groups_in_fea, "features_expanded.fea"),
+    "break-mark": (expand_mark_positioning_groups, "features_expanded_mark.fea"),
+}
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) < 2 or args[0] not in COMMANDS:
+        print(
+            "Usage: python -m fontra_feamerge {break-kerning|break-mark} path/to/font.ufo [input_fea_file] [output_fea_file]"
+        )
+        return 1
+
+    command, ufo_dir, *rest = args
+    func, default_output = COMMANDS[command]
+    input_fea_file = rest[0] if len(rest) > 0 else "features.fea"
+    output_fea_file = rest[1] if len(rest) > 1 else default_output
+
+    func(ufo_dir, input_fea_file, output_fea_file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,20 +3,125 @@ Fontra backend integration for feamerge plugin
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import itertools
 import logging
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Iterable, Optional
 
 from fontTools.designspaceLib import DesignSpaceDocument
-from fontTools.ufoLib2 import Font
 
-from .combine_features import VariableFeatureCombiner
+from .combine_feature import VariableFeatureCombiner
 from .break_groups_in_fea import expand_kerning_groups
-from .break_groups_in_mark_pos import expand_mark_positioning_groups
+from .break_groups_in_mark_pos import expand_mark_groups
+from .expand_groups import expand_all_groups
+from .fea_document import FeaDocument, feature_file_path
 
 logger = logging.getLogger(__name__)
 
 
+def _scaledProgress(
+    progress_callback: Optional[Callable], start: float, end: float
+) -> Optional[Callable]:
+    """Map a sub-operation's 0..1 progress into the start..end range."""
+    if progress_callback is None:
+        return None
+
+    async def scaled(fraction, message):
+        await progress_callback(start + fraction * (end - start), message)
+
+    return scaled
+
+
+async def _boundedMap(
+    coro_func: Callable, args: Iterable, limit: int
+) -> AsyncIterator[Any]:
+    """
+    Await coro_func(arg) for every arg, with at most limit running at once.
+    A new call starts as soon as any running one finishes, and results
+    are yielded in completion order. If one call fails, the others still
+    running are cancelled and no new ones are started.
+    """
+    args = iter(args)
+    pending = {
+        asyncio.ensure_future(coro_func(arg)) for arg in itertools.islice(args, limit)
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                for arg in itertools.islice(args, 1):
+                    pending.add(asyncio.ensure_future(coro_func(arg)))
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _sourcesSummary(processed: list, skipped: list) -> str:
+    """Describe how many sources were processed, and how many skipped."""
+    summary = f"{len(processed)} sources"
+    if skipped:
+        summary += f" ({len(skipped)} skipped without a readable features.fea)"
+    return summary
+
+
+# The per-source functions below run in worker processes, so they are
+# module-level functions of the UFO path rather than backend methods
+
+
+def _sourceDocument(ufo_path: str) -> Optional[FeaDocument]:
+    """
+    Return the parsed features.fea of a UFO source, or None if it cannot
+    be read, e.g. when missing or inside a zipped .ufoz source.
+    """
+    fea_path = feature_file_path(ufo_path, "features.fea")
+    try:
+        return FeaDocument.from_path(fea_path)
+    except OSError as e:
+        logger.warning(f"Skipping source, feature file not readable: {e}")
+        return None
+
+
+def _transformSource(ufo_path: str, transform: Callable, output_fea: str) -> bool:
+    """
+    Read a source's features.fea, apply the pure transform and
+    write the result, all in one worker round-trip.
+
+    Returns:
+        True if a file was written, False if the source was skipped
+    """
+    document = _sourceDocument(ufo_path)
+    if document is None:
+        return False
+    output_path = document.write_transformed(output_fea, transform)
+    logger.info(f"Expanded features file written to {output_path}")
+    return True
+
+
+_breakKerningGroupsInSource = functools.partial(
+    _transformSource,
+    transform=expand_kerning_groups,
+    output_fea="features_expanded.fea",
+)
+_breakMarkGroupsInSource = functools.partial(
+    _transformSource,
+    transform=expand_mark_groups,
+    output_fea="features_expanded_mark.fea",
+)
+_breakAllGroupsInSource = functools.partial(
+    _transformSource,
+    transform=expand_all_groups,
+    output_fea="features_expanded.fea",
+)
+
+
 class FeamergeBackend:
     """
     Backend for the Feamerge Fontra plugin.
@@ -42,6 +147,15 @@ class FeamergeBackend:
         self.combiner = None
         self._load_designspace()
 
+        # Expansion and merging are CPU-bound Python, so UFO sources run
+        # concurrently in worker processes rather than threads. "spawn"
+        # avoids forking the multi-threaded host process.
+        max_workers = min(len(self.designspace.sources), os.cpu_count() or 1)
+        self._process_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max(max_workers, 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
     def _load_designspace(self):
         """Load the designspace file."""
         if not self.path.exists():
@@ -54,6 +168,74 @@ class FeamergeBackend:
         self.combiner = VariableFeatureCombiner(str(self.path))
         logger.info(f"Loaded designspace: {self.path}")
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # Waiting for the workers blocks, so keep it off the event loop
+        await asyncio.to_thread(self.close)
+
+    def close(self):
+        """Shut down the worker processes, waiting for running jobs to finish."""
+        self._process_pool.shutdown(wait=True)
+
+    async def _runInProcess(self, func: Callable, *args) -> Any:
+        """Run a picklable function on the backend's worker process pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._process_pool, func, *args)
+
+    async def _processSources(
+        self,
+        func: Callable[[str], bool],
+        description: str,
+        progress_callback: Optional[Callable] = None,
+    ) -> tuple[list, list]:
+        """
+        Run a per-UFO function on all designspace sources concurrently,
+        keeping at most one source per CPU in flight.
+
+        Args:
+            func: Module-level function taking the UFO path, returning
+                whether it processed the source
+            description: What func does, used for logging
+            progress_callback: Optional callback, called as each source finishes
+
+        Returns:
+            Lists of processed and of skipped source filenames, in
+            completion order
+        """
+        sources = self.designspace.sources
+        total = len(sources)
+        processed = []
+        skipped = []
+
+        async def processSource(source):
+            ufo_path = self.path.parent / source.path
+            return source, await self._runInProcess(func, str(ufo_path))
+
+        # Bound the sources in flight so large designspaces don't hold every
+        # source's feature text at once, and a failure stops further work.
+        # aclosing() also cancels the running sources right away when the
+        # loop body raises, e.g. in progress_callback.
+        limit = os.cpu_count() or 1
+        async with contextlib.aclosing(
+            _boundedMap(processSource, sources, limit)
+        ) as results:
+            async for source, done in results:
+                if done:
+                    processed.append(source.filename)
+                    logger.info(f"{description} in: {source.filename}")
+                else:
+                    skipped.append(source.filename)
+
+                if progress_callback:
+                    finished = len(processed) + len(skipped)
+                    await progress_callback(
+                        finished / total, f"Processed {source.filename}"
+                    )
+
+        return processed, skipped
+
     async def mergeFeatures(
         self,
         output_path: Optional[str] = None,
@@ -73,16 +255,19 @@ class FeamergeBackend:
             if progress_callback:
                 await progress_callback(0.1, "Initializing feature merge...")
 
-            loop = asyncio.get_event_loop()
-
             if progress_callback:
                 await progress_callback(0.3, "Combining features...")
 
             output_file = output_path or "variable_features.fea"
             output_path = self.path.parent / output_file
 
-            await loop.run_in_executor(
-                None, self.combiner.save_combined_features, str(output_path)
+            # Parses the masters on the process pool, then streams the
+            # merged file chunk by chunk from worker threads, reporting
+            # progress as it goes
+            await self.combiner.save_combined_features_async(
+                str(output_path),
+                _scaledProgress(progress_callback, 0.3, 1.0),
+                executor=self._process_pool,
             )
 
             if progress_callback:
@@ -116,35 +301,23 @@ class FeamergeBackend:
             Dictionary with status and processed sources
         """
         try:
-            sources = self.designspace.sources
-            total = len(sources)
-            processed = []
-
             if progress_callback:
                 await progress_callback(0, "Starting kerning group expansion...")
 
-            loop = asyncio.get_event_loop()
-
-            for i, source in enumerate(sources):
-                ufo_path = self.path.parent / source.path
-
-                if progress_callback:
-                    await progress_callback(
-                        i / total, f"Processing {source.filename}..."
-                    )
-
-                await loop.run_in_executor(None, expand_kerning_groups, str(ufo_path))
-
-                processed.append(source.filename)
-                logger.info(f"Expanded kerning groups in: {source.filename}")
+            processed, skipped = await self._processSources(
+                _breakKerningGroupsInSource,
+                "Expanded kerning groups",
+                progress_callback,
+            )
 
             if progress_callback:
                 await progress_callback(1.0, "All kerning groups expanded!")
 
             return {
                 "status": "success",
-                "message": f"Kerning groups expanded in {len(processed)} sources",
+                "message": f"Kerning groups expanded in {_sourcesSummary(processed, skipped)}",
                 "processed": processed,
+                "skipped": skipped,
             }
 
         except Exception as e:
@@ -167,46 +340,72 @@ class FeamergeBackend:
             Dictionary with status and processed sources
         """
         try:
-            sources = self.designspace.sources
-            total = len(sources)
-            processed = []
-
             if progress_callback:
                 await progress_callback(
                     0, "Starting mark positioning group expansion..."
                 )
 
-            loop = asyncio.get_event_loop()
+            processed, skipped = await self._processSources(
+                _breakMarkGroupsInSource,
+                "Expanded mark groups",
+                progress_callback,
+            )
 
-            for i, source in enumerate(sources):
-                ufo_path = self.path.parent / source.path
+            if progress_callback:
+                await progress_callback(1.0, "All mark positioning groups expanded!")
 
-                if progress_callback:
-                    await progress_callback(
-                        i / total, f"Processing {source.filename}..."
-                    )
+            return {
+                "status": "success",
+                "message": f"Mark positioning groups expanded in {_sourcesSummary(processed, skipped)}",
+                "processed": processed,
+                "skipped": skipped,
+            }
 
-                await loop.run_in_executor(
-                    None, expand_mark_positioning_groups, str(ufo_path)
-                )
+        except Exception as e:
+            logger.error(f"Error breaking mark groups: {e}", exc_info=True)
+            return {
+                "status": "error",
+                "message": f"Error breaking mark groups: {str(e)}",
+            }
 
-                processed.append(source.filename)
-                logger.info(f"Expanded mark groups in: {source.filename}")
+    async def breakAllGroups(
+        self, progress_callback: Optional[Callable] = None
+    ) -> dict:
+        """
+        Break kerning and mark positioning groups in all UFO sources,
+        in a single pass over each feature file.
+
+        Args:
+            progress_callback: Optional callback for progress updates
 
+        Returns:
+            Dictionary with status and processed sources
+        """
+        try:
             if progress_callback:
-                await progress_callback(1.0, "All mark positioning groups expanded!")
+                await progress_callback(0, "Starting group expansion...")
+
+            processed, skipped = await self._processSources(
+                _breakAllGroupsInSource,
+                "Expanded kerning and mark groups",
+                progress_callback,
+            )
+
+            if progress_callback:
+                await progress_callback(1.0, "All groups expanded!")
 
             return {
                 "status": "success",
-                "message": f"Mark positioning groups expanded in {len(processed)} sources",
+                "message": f"Groups expanded in {_sourcesSummary(processed, skipped)}",
                 "processed": processed,
+                "skipped": skipped,
             }
 
         except Exception as e:
-            logger.error(f"Error breaking mark groups: {e}", exc_info=True)
+            logger.error(f"Error breaking groups: {e}", exc_info=True)
             return {
                 "status": "error",
-                "message": f"Error breaking mark groups: {str(e)}",
+                "message": f"Error breaking groups: {str(e)}",
             }
 
     async def processAll(
@@ -228,29 +427,22 @@ class FeamergeBackend:
             results = {}
 
             if progress_callback:
-                await progress_callback(0, "Step 1/3: Breaking kerning groups...")
+                await progress_callback(0, "Step 1/2: Breaking groups...")
 
-            kerning_result = await self.breakKerningGroups(progress_callback)
-            results["kerning"] = kerning_result
-
-            if kerning_result["status"] == "error":
-                return kerning_result
-
-            if progress_callback:
-                await progress_callback(
-                    0.33, "Step 2/3: Breaking mark positioning groups..."
-                )
-
-            mark_result = await self.breakMarkGroups(progress_callback)
-            results["mark"] = mark_result
+            groups_result = await self.breakAllGroups(
+                _scaledProgress(progress_callback, 0.0, 0.66)
+            )
+            results["groups"] = groups_result
 
-            if mark_result["status"] == "error":
-                return mark_result
+            if groups_result["status"] == "error":
+                return groups_result
 
             if progress_callback:
-                await progress_callback(0.66, "Step 3/3: Merging features...")
+                await progress_callback(0.66, "Step 2/2: Merging features...")
 
-            merge_result = await self.mergeFeatures(output_path, progress_callback)
+            merge_result = await self.mergeFeatures(
+                output_path, _scaledProgress(progress_callback, 0.66, 1.0)
+            )
             results["merge"] = merge_result
 
             if merge_result["status"] == "error":
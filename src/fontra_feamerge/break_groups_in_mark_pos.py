@@ -1,22 +1,34 @@
-import re
+import functools
 import os
-import sys
+import re
+
+from .fea_document import (
+    FeaDocument,
+    expand_side,
+    feature_file_path,
+    parse_groups,
+)
+
+# A 'pos mark' line laid out as POS_LINE_RE matches it, so that other pos
+# lines, such as kerning, never reach the Python callback
+MARK_LINE_RE = re.compile(r"^[^\S\r\n]*(pos mark[^\r\n]*)(\r\n|\n)?", re.MULTILINE)
 
 
-def parse_groups(fea_text):
+def split_mark_rule(line_strip):
     """
-    Parse group definitions in the feature file which look like:
-    @GroupName = [glyph1 glyph2 glyph3];
-    Returns a dict: {groupname: [glyphnames]}
+    Split a stripped line like: pos mark left right anchor 0 400;
+    into its (left, right, rest) parts, rest being everything between
+    the right side and the final semicolon. Returns None for any other
+    kind of line.
     """
-    group_pattern = re.compile(r"@(\w+)\s*=\s*\[([^\]]+)\];")
-    groups = {}
-    for match in group_pattern.finditer(fea_text):
-        group_name = match.group(1)
-        glyphs_str = match.group(2)
-        glyphs = glyphs_str.strip().split()
-        groups[group_name] = glyphs
-    return groups
+    tokens = line_strip.split(None, 4)
+    if len(tokens) != 5 or tokens[0] != "pos" or tokens[1] != "mark":
+        return None
+    left, right, rest = tokens[2:]
+    end = rest.rfind(";")
+    if end < 0:
+        return None
+    return left, right, rest[:end]
 
 
 def expand_groups_in_line(line, groups):
@@ -36,95 +48,92 @@ def expand_groups_in_line(line, groups):
     # 'pos mark leftGlyph rightGlyph anchor X Y;'
     # leftGlyph or rightGlyph can be groups (with @), or bracketed lists
 
-    # Regular expressions for 'pos mark' lines with two glyph or group specs
-    pos_mark_pattern = re.compile(r"pos\s+mark\s+(\S+)\s+(\S+)\s+(.*);")
-
-    m = pos_mark_pattern.match(line.strip())
-    if not m:
+    rule = split_mark_rule(line.strip())
+    if not rule:
         return [line]  # not a pos mark line
 
-    left, right, rest = m.groups()
-
-    def expand_side(side):
-        side = side.strip()
-        expanded = []
-        if side.startswith("[") and side.endswith("]"):
-            # e.g. [@Group glyph1 glyph2]
-            inner = side[1:-1].strip().split()
-            for el in inner:
-                if el.startswith("@"):
-                    group_name = el[1:]
-                    expanded.extend(groups.get(group_name, [el]))
-                else:
-                    expanded.append(el)
-        else:
-            if side.startswith("@"):
-                group_name = side[1:]
-                expanded.extend(groups.get(group_name, [side]))
-            else:
-                expanded.append(side)
-        return expanded
-
-    left_expanded = expand_side(left)
-    right_expanded = expand_side(right)
+    left, right, rest = rule
+    left_expanded = expand_side(left, groups)
+    right_expanded = expand_side(right, groups)
 
+    suffix = " " + rest + ";"
     expanded_lines = []
     for l in left_expanded:
-        for r in right_expanded:
-            expanded_lines.append(f"pos mark {l} {r} {rest};")
+        l_prefix = "pos mark " + l + " "
+        expanded_lines.extend([l_prefix + r + suffix for r in right_expanded])
 
     return expanded_lines
 
 
-def expand_mark_positioning_groups(
-    ufo_path, input_fea="features.fea", output_fea="features_expanded_mark.fea"
-):
-    fea_path = (
-        os.path.join(ufo_path, "features", input_fea)
-        if os.path.isdir(os.path.join(ufo_path, "features"))
-        else os.path.join(ufo_path, input_fea)
+def expand_mark_line(line, line_ending, groups):
+    """
+    Return the expanded lines of one matched 'pos mark' line joined with
+    its line ending, or None for other pos lines.
+    """
+    line_strip = line.strip()
+    if not line_strip.startswith("pos mark"):
+        return None
+    rule = split_mark_rule(line_strip)
+    if not rule:
+        return line_strip + (line_ending or "")
+
+    left, right, rest = rule
+    right_expanded = expand_side(right, groups)
+    if not right_expanded:
+        return ""
+
+    # Like the kerning rows, each left glyph's lines are built by one
+    # str.join over the right glyphs
+    newline = line_ending or "\n"
+    suffix = f" {rest};{newline}"
+    text = "".join(
+        [
+            f"pos mark {l} " + (suffix + f"pos mark {l} ").join(right_expanded) + suffix
+            for l in expand_side(left, groups)
+        ]
     )
-    if not os.path.exists(fea_path):
-        print(f"Feature file {fea_path} not found.")
-        return
-
-    with open(fea_path, encoding="utf-8") as f:
-        fea_text = f.read()
+    return text if line_ending else text[:-1]
 
-    groups = parse_groups(fea_text)
-    output_lines = []
 
-    for line in fea_text.splitlines():
-        line_strip = line.strip()
-        # Handle 'pos mark' lines; expand group references
-        if line_strip.startswith("pos mark"):
-            expanded = expand_groups_in_line(line_strip, groups)
-            output_lines.extend(expanded)
-        else:
-            # Copy other lines unchanged (including group definitions, etc)
-            output_lines.append(line)
+def expand_mark_match(match, groups):
+    """
+    Return the replacement for one MARK_LINE_RE match: the expanded
+    'pos mark' lines, or the matched text unchanged for other pos lines.
+    """
+    expanded = expand_mark_line(match.group(1), match.group(2), groups)
+    if expanded is None:
+        return match.group(0)
+    return expanded
 
-    expanded_fea = "\n".join(output_lines)
 
-    output_path = (
-        os.path.join(ufo_path, "features", output_fea)
-        if os.path.isdir(os.path.join(ufo_path, "features"))
-        else os.path.join(ufo_path, output_fea)
+def expand_mark_groups(fea_text, groups):
+    """
+    Expand group references in all 'pos mark' lines, copying all other
+    text unchanged. Returns the rewritten feature text.
+    """
+    if "pos mark" not in fea_text:
+        return fea_text
+    return MARK_LINE_RE.sub(
+        functools.partial(expand_mark_match, groups=groups), fea_text
     )
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(expanded_fea)
+
+
+def write_expanded_mark_positioning(document, output_fea="features_expanded_mark.fea"):
+    """
+    Expand mark positioning groups of a parsed FeaDocument and write
+    the result next to the original feature file.
+    """
+    output_path = document.write_transformed(output_fea, expand_mark_groups)
 
     print(f"Expanded mark positioning features file written to {output_path}")
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(
-            "Usage: python break_groups_in_mark_pos.py path/to/font.ufo [input_fea_file] [output_fea_file]"
-        )
-        sys.exit(1)
-    ufo_dir = sys.argv[1]
-    input_fea_file = sys.argv[2] if len(sys.argv) > 2 else "features.fea"
-    output_fea_file = sys.argv[3] if len(sys.argv) > 3 else "features_expanded_mark.fea"
+def expand_mark_positioning_groups(
+    ufo_path, input_fea="features.fea", output_fea="features_expanded_mark.fea"
+):
+    fea_path = feature_file_path(ufo_path, input_fea)
+    if not os.path.exists(fea_path):
+        print(f"Feature file {fea_path} not found.")
+        return
 
-    expand_mark_positioning_groups(ufo_dir, input_fea_file, output_fea_file)
+    write_expanded_mark_positioning(FeaDocument.from_path(fea_path), output_fea)
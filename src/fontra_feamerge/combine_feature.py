@@ -5,11 +5,210 @@ into a single variable features.fea file with proper variable font syntax.
 Includes support for variable mark positioning anchors.
 """
 
+import asyncio
+import io
 import os
 import re
+import sys
+import zipfile
 from fontTools.designspaceLib import DesignSpaceDocument
-from ufoLib2 import Font
 from collections import defaultdict, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# Patterns scanned once per master, compiled once at import
+_CLASS_RE = re.compile(r"@([a-zA-Z0-9_.]+)\s*=\s*\[(.*?)\];", re.DOTALL)
+_KERN_RE = re.compile(r"pos\s+\\([A-Za-z0-9_]+)\s+\\([A-Za-z0-9_]+)\s+(-?\d+);")
+_LOOKUP_START_RE = re.compile(r"lookup\s+(\w+)\s*\{")
+_LOOKUP_END_RE = re.compile(r"\}\s*(\w+);")
+_BRACE_OR_COMMENT_RE = re.compile(r"[{}#]")
+_MARKCLASS_RE = re.compile(
+    r"markClass\s+\[(.*?)\]\s+<anchor\s+(-?\d+)\s+(-?\d+)\s*>\s+@(\w+);"
+)
+_POSBASE_RE = re.compile(
+    r"pos\s+base\s+\[(.*?)\]\s+<anchor\s+(-?\d+)\s+(-?\d+)\s*>\s+mark\s+@(\w+);"
+)
+_GDEF_RE = re.compile(r"(table GDEF \{.*?\} GDEF;)", re.DOTALL)
+
+# Fixed blocks of the generated file, each yielded as one multi-line
+# item by iter_feature_lines, which separates items with newlines
+_HEADER = """\
+languagesystem DFLT dflt;
+languagesystem latn dflt;
+
+# Variable features.fea generated from designspace masters
+"""
+_MARK_FEATURE_TPL = """\
+feature mark {{
+    script DFLT;
+    language dflt ;
+    lookup {name};
+    script latn;
+    language dflt ;
+    lookup {name};
+}} mark;
+"""
+
+
+def _format_location_prefix(location):
+    """
+    Return the 'axis=value,...:' prefix that introduces a master's value
+    in variable font coordinate syntax, or ':' for an empty location.
+    """
+    return ",".join(f"{tag}={value}" for tag, value in location.items()) + ":"
+
+
+def _find_block_end(text, pos):
+    """
+    Return the index of the brace closing the block whose body starts at
+    pos, skipping braces in # comments, or -1 if the block is unclosed.
+    """
+    depth = 0
+    while True:
+        match = _BRACE_OR_COMMENT_RE.search(text, pos)
+        if match is None:
+            return -1
+        char = match.group()
+        if char == "#":
+            pos = text.find("\n", match.end())
+            if pos < 0:
+                return -1
+            continue
+        if char == "{":
+            depth += 1
+        elif depth:
+            depth -= 1
+        else:
+            return match.start()
+        pos = match.end()
+
+
+def _iter_lookup_blocks(text):
+    """
+    Yield (name, body) for each 'lookup name { body } name;' block in text.
+    Blocks are found in one forward pass, tracking brace depth instead of
+    searching for the closing name with a backreference.
+    """
+    pos = 0
+    while True:
+        start = _LOOKUP_START_RE.search(text, pos)
+        if start is None:
+            return
+        name = start.group(1)
+        pos = start.end()
+        end = _find_block_end(text, pos)
+        if end < 0:
+            continue
+        close = _LOOKUP_END_RE.match(text, end)
+        if close is None or close.group(1) != name:
+            continue
+        yield name, text[pos:end]
+        pos = close.end()
+
+
+def _read_ufo_features(ufo_path):
+    """
+    Return the features.fea text of a UFO folder or a packaged .ufoz, or
+    an empty string if it has none. Only the feature file is read, rather
+    than loading the whole font.
+    """
+    if os.path.isdir(ufo_path):
+        fea_path = os.path.join(ufo_path, "features.fea")
+        if not os.path.exists(fea_path):
+            return ""
+        with open(fea_path, encoding="utf-8") as f:
+            return f.read()
+
+    # A .ufoz holds the UFO folder, or its contents, at the top level
+    with zipfile.ZipFile(ufo_path) as z:
+        for name in z.namelist():
+            if name == "features.fea" or (
+                name.endswith("/features.fea") and name.count("/") == 1
+            ):
+                with z.open(name) as f:
+                    return io.TextIOWrapper(f, encoding="utf-8").read()
+    return ""
+
+
+def _features_cache_key(ufo_path):
+    """
+    Return (path, mtime_ns) of the file holding a UFO's features, which
+    changes whenever the features may have. The mtime is None if the UFO
+    has no features.fea.
+    """
+    if os.path.isdir(ufo_path):
+        path = os.path.join(ufo_path, "features.fea")
+        if not os.path.exists(path):
+            return path, None
+    else:
+        path = ufo_path
+    return path, os.stat(path).st_mtime_ns
+
+
+def _parse_glyph_classes(features_text):
+    """Extract glyph class definitions from feature text"""
+    return {
+        class_name: glyph_content.split()
+        for class_name, glyph_content in _CLASS_RE.findall(features_text)
+    }
+
+
+def _extract_kern_pairs(features_text):
+    """Extract (left, right, value) kern pairs from feature text"""
+    return [
+        (left_glyph, right_glyph, int(value))
+        for left_glyph, right_glyph, value in _KERN_RE.findall(features_text)
+    ]
+
+
+def _extract_mark_anchors(features_text):
+    """
+    Extract markClass and pos base anchors from lookup blocks, each as a
+    list of (lookup_name, glyphs, x, y, mark_class)
+    """
+    mark_classes = []
+    mark_bases = []
+    for lookup_name, lookup_content in _iter_lookup_blocks(features_text):
+        for anchors, pattern in (
+            (mark_classes, _MARKCLASS_RE),
+            (mark_bases, _POSBASE_RE),
+        ):
+            for glyphs, x_coord, y_coord, mark_class in pattern.findall(lookup_content):
+                anchors.append(
+                    (
+                        lookup_name,
+                        glyphs.strip(),
+                        int(x_coord),
+                        int(y_coord),
+                        mark_class,
+                    )
+                )
+    return mark_classes, mark_bases
+
+
+def _parse_master(features_text):
+    """
+    Parse one master's feature text into its glyph classes, kern pairs,
+    markClass anchors and pos base anchors. Masters are independent, so
+    this runs in a worker process when an executor is available.
+    """
+    return (
+        _parse_glyph_classes(features_text),
+        _extract_kern_pairs(features_text),
+        *_extract_mark_anchors(features_text),
+    )
+
+
+def _set_master_entry(entries, entry):
+    """
+    Add entry, a tuple starting with its master index, to entries. A
+    repeated entry from the same master replaces the earlier one, so the
+    last definition in a master wins. Masters are merged in order, so
+    that entry is always the last one.
+    """
+    if entries and entries[-1][0] == entry[0]:
+        entries[-1] = entry
+    else:
+        entries.append(entry)
 
 
 class VariableFeatureCombiner:
@@ -17,11 +216,16 @@ class VariableFeatureCombiner:
         self.designspace_path = designspace_path
         self.designspace = DesignSpaceDocument.fromfile(designspace_path)
         self.masters_data = {}
+        self.master_meta = []
         self.combined_classes = {}
-        self.kern_pairs = defaultdict(dict)
-        self.mark_classes = defaultdict(dict)
-        self.mark_bases = defaultdict(dict)
+        self.kern_pairs = defaultdict(list)
+        self.mark_classes = defaultdict(list)
+        self.mark_bases = defaultdict(list)
+        self.mark_class_meta = {}
+        self.mark_base_meta = {}
         self.lookups = defaultdict(dict)
+        # (features path, mtime) -> (features text, _parse_master result)
+        self._parsed_masters = {}
         self.axis_mappings = {}
 
         # Extract axis information
@@ -51,294 +255,263 @@ class VariableFeatureCombiner:
                 continue
 
             try:
-                font = Font.open(ufo_path)
-                features_content = font.features.text if font.features.text else ""
+                cache_key = _features_cache_key(ufo_path)
+                cached = self._parsed_masters.get(cache_key)
+                if cached:
+                    features_content = cached[0]
+                else:
+                    features_content = _read_ufo_features(ufo_path)
 
                 location = source.location or {}
                 master_key = source.filename or os.path.basename(source.path)
 
                 self.masters_data[master_key] = {
                     "location": location,
+                    # Shared by every value formatted for this master
+                    "coord_prefix": _format_location_prefix(location),
                     "features": features_content,
-                    "font": font,
+                    "cache_key": cache_key,
                 }
 
             except Exception as e:
                 print(f"Error loading UFO {ufo_path}: {e}")
 
-    def parse_glyph_classes(self, features_text):
-        """Extract glyph class definitions from feature text"""
-        classes = {}
-        class_pattern = r"@([a-zA-Z0-9_.]+)\s*=\s*\[(.*?)\];"
-
-        for match in re.finditer(class_pattern, features_text, re.DOTALL):
-            class_name = match.group(1)
-            glyph_content = match.group(2).strip()
-            if "\\" in glyph_content:
-                glyph_list = [g.strip() for g in glyph_content.split() if g.strip()]
-            else:
-                glyph_list = [g.strip() for g in glyph_content.split() if g.strip()]
-            classes[class_name] = glyph_list
-
-        return classes
-
-    def extract_positioning_data(self, features_text, master_key):
-        """Extract positioning data from lookups including kern and mark"""
-        location = self.masters_data[master_key]["location"]
-
-        # Extract kern positioning
-        kern_pattern = r"pos\s+\\([A-Za-z0-9_]+)\s+\\([A-Za-z0-9_]+)\s+(-?\d+);"
-        for match in re.finditer(kern_pattern, features_text):
-            left_glyph = match.group(1)
-            right_glyph = match.group(2)
-            value = int(match.group(3))
-
-            pair_key = f"{left_glyph} {right_glyph}"
-            self.kern_pairs[pair_key][master_key] = {
-                "value": value,
-                "location": location,
-            }
-
-    def extract_mark_anchors(self, features_text, master_key):
-        """Extract mark anchor data from lookup blocks"""
-        location = self.masters_data[master_key]["location"]
-
-        # Find lookup blocks
-        lookup_pattern = r"lookup\s+(\w+)\s*\{(.*?)\}\s*\1;"
-
-        for lookup_match in re.finditer(lookup_pattern, features_text, re.DOTALL):
-            lookup_name = lookup_match.group(1)
-            lookup_content = lookup_match.group(2)
-
-            # Extract markClass statements
-            markclass_pattern = (
-                r"markClass\s+\[(.*?)\]\s+<anchor\s+(-?\d+)\s+(-?\d+)\s*>\s+@(\w+);"
-            )
-            for mark_match in re.finditer(markclass_pattern, lookup_content):
-                glyphs = mark_match.group(1).strip()
-                x_coord = int(mark_match.group(2))
-                y_coord = int(mark_match.group(3))
-                mark_class = mark_match.group(4)
-
-                markclass_key = f"{glyphs}@{mark_class}"
-                if markclass_key not in self.mark_classes:
-                    self.mark_classes[markclass_key] = {}
-
-                self.mark_classes[markclass_key][master_key] = {
-                    "x": x_coord,
-                    "y": y_coord,
-                    "location": location,
-                    "glyphs": glyphs,
-                    "mark_class": mark_class,
-                    "lookup_name": lookup_name,
-                }
-
-            # Extract pos base statements
-            posbase_pattern = r"pos\s+base\s+\[(.*?)\]\s+<anchor\s+(-?\d+)\s+(-?\d+)\s*>\s+mark\s+@(\w+);"
-            for base_match in re.finditer(posbase_pattern, lookup_content):
-                glyphs = base_match.group(1).strip()
-                x_coord = int(base_match.group(2))
-                y_coord = int(base_match.group(3))
-                mark_class = base_match.group(4)
-
-                base_key = f"{glyphs}@{mark_class}"
-                if base_key not in self.mark_bases:
-                    self.mark_bases[base_key] = {}
-
-                self.mark_bases[base_key][master_key] = {
-                    "x": x_coord,
-                    "y": y_coord,
-                    "location": location,
-                    "glyphs": glyphs,
-                    "mark_class": mark_class,
-                    "lookup_name": lookup_name,
-                }
-
-    def merge_classes(self):
-        """Merge glyph classes from all masters"""
-        all_classes = defaultdict(set)
-
-        for master_name, master_data in self.masters_data.items():
-            classes = self.parse_glyph_classes(master_data["features"])
+    def merge_classes(self, master_classes):
+        """Merge the glyph classes parsed from each master"""
+        glyph_lists = defaultdict(list)
+        for classes in master_classes:
             for class_name, glyphs in classes.items():
-                all_classes[class_name].update(glyphs)
+                glyph_lists[class_name].append(glyphs)
 
-        self.combined_classes = {
-            name: sorted(list(glyphs)) for name, glyphs in all_classes.items()
-        }
+        # Glyph names are stored escaped, ready to be written out
+        self.combined_classes = {}
+        for class_name, lists in glyph_lists.items():
+            # One union call over every master's list of the class
+            glyphs = sorted(set().union(*lists))
+            # Escape every name without branching; an already escaped
+            # name loses its backslash and gets it back
+            self.combined_classes[class_name] = [
+                "\\" + g.removeprefix("\\") for g in glyphs
+            ]
 
-    def format_variable_positioning(self, master_data):
-        """Format positioning values with variable font coordinate syntax"""
-        if not master_data:
+    def merge_master_data(self, master_idx, kern_pairs, mark_classes, mark_bases):
+        """
+        Add the kerning and anchors parsed from the master at master_idx in
+        master_meta. Entries refer to their master by index, so per-master
+        data like the location is stored once, in master_meta.
+        """
+        for left_glyph, right_glyph, value in kern_pairs:
+            pair_key = (sys.intern(left_glyph), sys.intern(right_glyph))
+            _set_master_entry(self.kern_pairs[pair_key], (master_idx, value))
+
+        # Entries hold only each master's coordinates. The anchor's glyphs,
+        # mark class and lookup name are stored once in the meta tables,
+        # as defined by the first master
+        for anchors, merged, meta in (
+            (mark_classes, self.mark_classes, self.mark_class_meta),
+            (mark_bases, self.mark_bases, self.mark_base_meta),
+        ):
+            for lookup_name, glyphs, x_coord, y_coord, mark_class in anchors:
+                anchor_key = f"{glyphs}@{mark_class}"
+                entries = merged[anchor_key]
+                _set_master_entry(entries, (master_idx, x_coord, y_coord))
+                if len(entries) == 1:
+                    meta[anchor_key] = (glyphs, mark_class, lookup_name)
+
+    def format_variable_positioning(self, entries):
+        """
+        Format positioning values, given as (master_idx, value) entries,
+        with variable font coordinate syntax
+        """
+        if not entries:
             return "0"
 
-        coordinate_values = []
-        for master_key, data in master_data.items():
-            location = data["location"]
-            value = data["value"]
-
-            coords = []
-            for axis_tag, axis_value in location.items():
-                coords.append(f"{axis_tag}={axis_value}")
-
-            if coords:
-                coord_str = ",".join(coords)
-                coordinate_values.append(f"{coord_str}:{value}")
-            else:
-                coordinate_values.append(f":{value}")
-
-        return " ".join(coordinate_values) if coordinate_values else "0"
+        master_meta = self.master_meta
+        return " ".join(
+            master_meta[master_idx]["coord_prefix"] + str(value)
+            for master_idx, value in entries
+        )
 
-    def format_variable_anchor(self, master_data):
-        """Format anchor coordinates with variable font coordinate syntax"""
-        if not master_data:
+    def format_variable_anchor(self, entries):
+        """
+        Format anchor coordinates, given as (master_idx, x, y) entries,
+        with variable font coordinate syntax
+        """
+        if not entries:
             return "<anchor 0 0>"
 
+        master_meta = self.master_meta
         x_coordinates = []
         y_coordinates = []
+        for master_idx, x_coord, y_coord in entries:
+            coord_prefix = master_meta[master_idx]["coord_prefix"]
+            x_coordinates.append(coord_prefix + str(x_coord))
+            y_coordinates.append(coord_prefix + str(y_coord))
 
-        for master_key, data in master_data.items():
-            location = data["location"]
-            x_coord = data["x"]
-            y_coord = data["y"]
-
-            coords = []
-            for axis_tag, axis_value in location.items():
-                coords.append(f"{axis_tag}={axis_value}")
-
-            if coords:
-                coord_str = ",".join(coords)
-                x_coordinates.append(f"{coord_str}:{x_coord}")
-                y_coordinates.append(f"{coord_str}:{y_coord}")
-            else:
-                x_coordinates.append(f":{x_coord}")
-                y_coordinates.append(f":{y_coord}")
-
-        x_values = " ".join(x_coordinates) if x_coordinates else "0"
-        y_values = " ".join(y_coordinates) if y_coordinates else "0"
-
-        return f"<anchor {x_values} {y_values}>"
+        return f"<anchor {' '.join(x_coordinates)} {' '.join(y_coordinates)}>"
 
     def generate_variable_features(self):
         """Generate the complete variable features.fea content"""
-        output_lines = []
-
+        buffer = io.StringIO()
+        self.write_variable_features(buffer)
+        return buffer.getvalue()
+
+    def write_variable_features(self, f):
+        """
+        Write the variable features.fea content to the text file f line
+        by line, without building the whole text in memory first
+        """
+        lines = self.iter_feature_lines()
+        f.write(next(lines, ""))
+        for line in lines:
+            f.write("\n")
+            f.write(line)
+
+    def iter_combined_chunks(self, chunk_lines=1000):
+        """Yield the variable features.fea content in chunks of chunk_lines lines"""
+        batch = []
+        for line in self.iter_feature_lines():
+            if len(batch) == chunk_lines:
+                yield "\n".join(batch) + "\n"
+                batch = []
+            batch.append(line)
+        yield "\n".join(batch)
+
+    def count_feature_lines(self):
+        """
+        Return how many lines iter_feature_lines yields, without
+        formatting the kern and anchor rows
+        """
+        return sum(1 for _ in self.iter_feature_lines(format_rows=False))
+
+    def iter_feature_lines(self, format_rows=True):
+        """
+        Generate the variable features.fea content line by line. With
+        format_rows False, kern and anchor rows are yielded as None, so
+        lines can be counted without the cost of formatting them
+        """
         # Add header
-        output_lines.extend(
-            [
-                "languagesystem DFLT dflt;",
-                "languagesystem latn dflt;",
-                "",
-                "# Variable features.fea generated from designspace masters",
-                "",
-            ]
-        )
+        yield _HEADER
 
         # Add glyph class definitions
         if self.combined_classes:
             for class_name, glyphs in self.combined_classes.items():
                 if glyphs:
-                    glyph_list = " ".join(
-                        [f"\\{g}" if not g.startswith("\\") else g for g in glyphs]
-                    )
-                    output_lines.append(f"@{class_name} = [{glyph_list}];")
-            output_lines.append("")
+                    yield f"@{class_name} = [{' '.join(glyphs)}];"
+            yield ""
 
         # Generate kern feature with variable syntax
         if self.kern_pairs:
-            output_lines.append("feature kern {")
-
-            for pair_key, master_data in self.kern_pairs.items():
-                variable_value = self.format_variable_positioning(master_data)
-                if variable_value != "0":
-                    left, right = pair_key.split(" ", 1)
-                    output_lines.append(
-                        f"    pos \\{left} \\{right} ({variable_value});"
-                    )
+            yield "feature kern {"
+
+            for (left, right), entries in self.kern_pairs.items():
+                # A pair that is zero in every master does nothing, so it
+                # is skipped before any formatting
+                if not any(value for _, value in entries):
+                    continue
+                if not format_rows:
+                    yield None
+                    continue
+                variable_value = self.format_variable_positioning(entries)
+                yield f"    pos \\{left} \\{right} ({variable_value});"
 
-            output_lines.extend(["} kern;", ""])
+            yield from ["} kern;", ""]
 
         # Generate mark feature with variable anchor syntax
         if self.mark_classes or self.mark_bases:
             # Get lookup name from the first mark class or base
             lookup_name = "markMarkPositioninginLatinlookup2"
-            if self.mark_classes:
-                first_markclass = next(iter(self.mark_classes.values()))
-                if first_markclass:
-                    lookup_name = next(iter(first_markclass.values()))["lookup_name"]
-            elif self.mark_bases:
-                first_base = next(iter(self.mark_bases.values()))
-                if first_base:
-                    lookup_name = next(iter(first_base.values()))["lookup_name"]
-
-            output_lines.append(f"lookup {lookup_name} {{")
-            output_lines.append("  lookupflag 0;")
+            first_meta = next(
+                iter((self.mark_class_meta or self.mark_base_meta).values()), None
+            )
+            if first_meta:
+                lookup_name = first_meta[2]
+
+            yield f"lookup {lookup_name} {{"
+            yield "  lookupflag 0;"
 
             # Add markClass statements
-            for markclass_key, master_data in self.mark_classes.items():
-                if master_data:
-                    sample_data = next(iter(master_data.values()))
-                    glyphs = sample_data["glyphs"]
-                    mark_class = sample_data["mark_class"]
-                    variable_anchor = self.format_variable_anchor(master_data)
-
-                    output_lines.append(
+            for anchor_key, entries in self.mark_classes.items():
+                if entries and not format_rows:
+                    yield None
+                elif entries:
+                    glyphs, mark_class, _ = self.mark_class_meta[anchor_key]
+                    variable_anchor = self.format_variable_anchor(entries)
+
+                    yield (
                         f"  markClass [\\{glyphs} ] {variable_anchor} @{mark_class};"
                     )
 
             # Add pos base statements
-            for base_key, master_data in self.mark_bases.items():
-                if master_data:
-                    sample_data = next(iter(master_data.values()))
-                    glyphs = sample_data["glyphs"]
-                    mark_class = sample_data["mark_class"]
-                    variable_anchor = self.format_variable_anchor(master_data)
-
-                    output_lines.append(
+            for anchor_key, entries in self.mark_bases.items():
+                if entries and not format_rows:
+                    yield None
+                elif entries:
+                    glyphs, mark_class, _ = self.mark_base_meta[anchor_key]
+                    variable_anchor = self.format_variable_anchor(entries)
+
+                    yield (
                         f"  pos base [\\{glyphs} ] {variable_anchor} mark @{mark_class};"
                     )
 
-            output_lines.extend([f"}} {lookup_name};", ""])
+            yield from [f"}} {lookup_name};", ""]
 
             # Add feature mark block
-            output_lines.extend(
-                [
-                    "feature mark {",
-                    "    script DFLT;",
-                    "    language dflt ;",
-                    f"    lookup {lookup_name};",
-                    "    script latn;",
-                    "    language dflt ;",
-                    f"    lookup {lookup_name};",
-                    "} mark;",
-                    "",
-                ]
-            )
+            yield _MARK_FEATURE_TPL.format(name=lookup_name)
 
         # Add GDEF table
         sample_features = next(iter(self.masters_data.values()))["features"]
-        gdef_pattern = r"(table GDEF \{.*?\} GDEF;)"
-        gdef_match = re.search(gdef_pattern, sample_features, re.DOTALL)
+        gdef_match = _GDEF_RE.search(sample_features)
         if gdef_match:
-            output_lines.extend([gdef_match.group(1), ""])
+            yield from [gdef_match.group(1), ""]
 
-        return "\n".join(output_lines)
+    def prepare_features(self, executor=None):
+        """
+        Load all masters and collect their classes, kerning and anchors.
+        Masters are parsed in parallel on executor, if given.
+        """
+        self.masters_data = {}
+        self.kern_pairs = defaultdict(list)
+        self.mark_classes = defaultdict(list)
+        self.mark_bases = defaultdict(list)
+        self.mark_class_meta = {}
+        self.mark_base_meta = {}
 
-    def save_combined_features(self, output_path):
-        """Save the combined variable features.fea file"""
         self.load_ufo_features()
-        self.merge_classes()
-
-        # Extract positioning data from all masters
-        for master_key, master_data in self.masters_data.items():
-            self.extract_positioning_data(master_data["features"], master_key)
-            self.extract_mark_anchors(master_data["features"], master_key)
-
-        variable_features_content = self.generate_variable_features()
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(variable_features_content)
-
+        self.master_meta = list(self.masters_data.values())
+
+        # Only masters whose features changed since the last run are parsed
+        parsed_masters = {}
+        to_parse = []
+        for master_data in self.master_meta:
+            cache_key = master_data["cache_key"]
+            if cache_key in self._parsed_masters:
+                parsed_masters[cache_key] = self._parsed_masters[cache_key]
+            else:
+                to_parse.append(master_data)
+        texts = [master_data["features"] for master_data in to_parse]
+        for master_data, master_parsed in zip(
+            to_parse, (executor.map if executor else map)(_parse_master, texts)
+        ):
+            parsed_masters[master_data["cache_key"]] = (
+                master_data["features"],
+                master_parsed,
+            )
+        # Entries of masters that changed or went away are dropped
+        self._parsed_masters = parsed_masters
+        parsed = [
+            parsed_masters[master_data["cache_key"]][1]
+            for master_data in self.master_meta
+        ]
+
+        # Merge in master order, so the output does not depend on which
+        # worker finished first
+        self.merge_classes(classes for classes, *_ in parsed)
+        for master_idx, (_, *master_data) in enumerate(parsed):
+            self.merge_master_data(master_idx, *master_data)
+
+    def print_summary(self, output_path):
+        """Print what was written to output_path"""
         print(f"Variable features.fea saved to: {output_path}")
         print(f"Masters processed: {len(self.masters_data)}")
         print(f"Kern pairs found: {len(self.kern_pairs)}")
@@ -346,10 +519,55 @@ class VariableFeatureCombiner:
         print(f"Mark bases found: {len(self.mark_bases)}")
         print(f"Classes combined: {len(self.combined_classes)}")
 
+    def save_combined_features(self, output_path, executor=None):
+        """
+        Save the combined variable features.fea file, parsing the masters
+        on executor if given
+        """
+        self.prepare_features(executor)
 
-def main():
-    import sys
+        with open(output_path, "w", encoding="utf-8") as f:
+            self.write_variable_features(f)
+
+        self.print_summary(output_path)
+
+    async def save_combined_features_async(
+        self, output_path, progress_callback=None, chunk_lines=1000, executor=None
+    ):
+        """
+        Save the combined variable features.fea file without blocking the
+        event loop: parsing, generating and writing each chunk run in
+        worker threads, and progress_callback(fraction, message) is
+        awaited after every chunk written. Masters are parsed on
+        executor, such as a process pool, if given.
+        """
+        await asyncio.to_thread(self.prepare_features, executor)
+
+        total_lines = await asyncio.to_thread(self.count_feature_lines)
+        chunks = self.iter_combined_chunks(chunk_lines)
+        written = 0
+
+        f = await asyncio.to_thread(open, output_path, "w", encoding="utf-8")
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                await asyncio.to_thread(f.write, chunk)
+                # Every chunk but the last holds chunk_lines lines
+                written = min(written + chunk_lines, total_lines)
+                if progress_callback:
+                    await progress_callback(
+                        written / total_lines,
+                        "Writing variable features...",
+                    )
+        finally:
+            await asyncio.to_thread(f.close)
 
+        self.print_summary(output_path)
+
+
+def main():
     if len(sys.argv) != 3:
         print(
             "Usage: python combine_features.py <designspace_file> <output_features.fea>"
@@ -365,7 +583,8 @@ def main():
 
     try:
         combiner = VariableFeatureCombiner(designspace_path)
-        combiner.save_combined_features(output_path)
+        with ProcessPoolExecutor() as executor:
+            combiner.save_combined_features(output_path, executor)
         print("✓ Successfully generated variable features file with mark support")
 
     except Exception as e:
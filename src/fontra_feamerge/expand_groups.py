@@ -0,0 +1,36 @@
+"""
+Expand kerning and mark positioning groups in a single pass
+"""
+
+from .break_groups_in_fea import KERNING_LINE_RE, expand_kerning_match
+from .break_groups_in_mark_pos import expand_mark_line
+
+
+def is_mark_positioning_line(line_strip):
+    """Return True for a stripped 'pos mark ...' line."""
+    return line_strip.startswith("pos mark") and line_strip[8:9].isspace()
+
+
+def expand_all_groups(fea_text, groups):
+    """
+    Expand group references in both 'pos mark' and kerning lines,
+    classifying each pos line once, and copy all other text unchanged.
+
+    Returns the rewritten feature text.
+    """
+
+    def expand_match(match):
+        left = match.group(2)
+        # KERNING_LINE_RE already captured the parts of a kerning pair,
+        # so only lines that are not one need classifying
+        if left is not None and left != "mark":
+            return expand_kerning_match(match, groups)
+        line = match.group(1)
+        if is_mark_positioning_line(line):
+            expanded = expand_mark_line(line, match.group(5), groups)
+            return match.group(0) if expanded is None else expanded
+        if left is None:
+            return match.group(0)
+        return expand_kerning_match(match, groups)
+
+    return KERNING_LINE_RE.sub(expand_match, fea_text)
@@ -0,0 +1,129 @@
+"""
+Feature file parsed once and shared between the group expansion passes
+"""
+
+import functools
+import os
+import re
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+# A line holding a pos statement: indentation, the statement itself and
+# the line ending, if any. Rewriting only these lines with sub() leaves
+# the rest of the feature text untouched.
+POS_LINE_RE = re.compile(r"^[^\S\r\n]*(pos [^\r\n]*)(\r\n|\n)?", re.MULTILINE)
+
+# A group definition: @GroupName = [glyph1 glyph2 glyph3];
+GROUP_RE = re.compile(r"@(\w+)\s*=\s*\[([^\]]+)\];")
+
+
+def feature_file_path(ufo_path, filename):
+    """
+    Return the path of a feature file inside a UFO, using the
+    features/ subfolder when the UFO has one.
+    """
+    features_dir = os.path.join(ufo_path, "features")
+    if os.path.isdir(features_dir):
+        return os.path.join(features_dir, filename)
+    return os.path.join(ufo_path, filename)
+
+
+def parse_groups(fea_text):
+    """
+    Parse group definitions in the feature file which look like:
+    @GroupName = [glyph1 glyph2 glyph3];
+    Returns a read-only mapping: {groupname: (glyphnames)}
+    """
+    groups = {}
+    for group_name, glyphs_str in GROUP_RE.findall(fea_text):
+        # Glyph names recur across groups and expanded pairs; interning
+        # makes them share one string object and speeds up dict lookups
+        groups[sys.intern(group_name)] = tuple(map(sys.intern, glyphs_str.split()))
+    return MappingProxyType(groups)
+
+
+@functools.lru_cache(maxsize=4096)
+def tokenize_side(side):
+    """
+    Split one side of a pos rule, which may be a glyph, a @Group
+    reference or a bracketed list of either, into (is_group, name)
+    pairs. Group names are given without the @.
+
+    Sides recur across rules and sources, so results are cached.
+    """
+    side = side.strip()
+    if side.startswith("[") and side.endswith("]"):
+        elements = side[1:-1].split()
+    else:
+        elements = [side]
+    return tuple(
+        (True, sys.intern(el[1:])) if el.startswith("@") else (False, sys.intern(el))
+        for el in elements
+    )
+
+
+def expand_side(side, groups):
+    """
+    Return the glyph names of one side of a pos rule, substituting the
+    contents of the groups it references. Unknown groups are kept as
+    @Group. Group contents are returned as the shared tuple, not a copy.
+    """
+    if "@" not in side:
+        # Only literal glyphs, nothing to look up; this also skips the
+        # tokenize_side cache, which unique glyph sides would only churn
+        side = side.strip()
+        if side.startswith("[") and side.endswith("]"):
+            return list(map(sys.intern, side[1:-1].split()))
+        return (sys.intern(side),)
+    tokens = tokenize_side(side)
+    if len(tokens) == 1:
+        is_group, name = tokens[0]
+        if not is_group:
+            return (name,)
+        if name in groups:
+            return groups[name]
+        return ("@" + name,)
+    expanded = []
+    for is_group, name in tokens:
+        if not is_group:
+            expanded.append(name)
+        elif name in groups:
+            expanded.extend(groups[name])
+        else:
+            expanded.append("@" + name)
+    return expanded
+
+
+class FeaDocument:
+    """
+    A feature file read and parsed once, so that the kerning and mark
+    expansion passes over the same UFO can share the text and the group
+    definitions.
+    """
+
+    def __init__(self, path, text):
+        self.path = path
+        self.text = text
+        self.groups = parse_groups(text)
+
+    @classmethod
+    def from_path(cls, fea_path):
+        """Read and parse the feature file at fea_path."""
+        # Decoding the whole file at once is cheaper than a text-mode read,
+        # and keeps the file's own line endings
+        return cls(fea_path, Path(fea_path).read_bytes().decode("utf-8"))
+
+    def sibling_path(self, filename):
+        """Return the path of filename next to this feature file."""
+        return os.path.join(os.path.dirname(self.path), filename)
+
+    def write_transformed(self, output_fea, transform):
+        """
+        Write transform(text, groups) next to this feature file and
+        return the output path. transform is a pure function returning
+        the new feature text, such as expand_kerning_groups.
+        """
+        output_path = self.sibling_path(output_fea)
+        Path(output_path).write_bytes(transform(self.text, self.groups).encode("utf-8"))
+        return output_path
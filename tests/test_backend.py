@@ -0,0 +1,153 @@
+import asyncio
+import os
+import zipfile
+
+import pytest
+from fontTools.designspaceLib import DesignSpaceDocument
+
+from fontra_feamerge.backend import (
+    FeamergeBackend,
+    _boundedMap,
+    _breakKerningGroupsInSource,
+    _sourceDocument,
+)
+
+from .test_combine_feature import _write_designspace
+
+
+def test_source_document_skips_unreadable_sources(tmp_path):
+    assert _sourceDocument(str(tmp_path / "Missing.ufo")) is None
+
+    ufoz = tmp_path / "Font.ufoz"
+    with zipfile.ZipFile(ufoz, "w") as z:
+        z.writestr("Font.ufo/features.fea", "pos a b -5;\n")
+    assert _sourceDocument(str(ufoz)) is None
+
+
+@pytest.mark.asyncio
+async def test_bounded_map_limits_concurrency():
+    running = []
+    peak = 0
+
+    async def work(arg):
+        nonlocal peak
+        running.append(arg)
+        peak = max(peak, len(running))
+        await asyncio.sleep(0.001 * (arg % 3))
+        running.remove(arg)
+        return arg
+
+    results = [result async for result in _boundedMap(work, range(10), 3)]
+    assert sorted(results) == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_bounded_map_yields_in_completion_order():
+    async def work(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    results = [result async for result in _boundedMap(work, [0.03, 0.01, 0.02], 3)]
+    assert results == [0.01, 0.02, 0.03]
+
+
+@pytest.mark.asyncio
+async def test_bounded_map_cancels_on_failure():
+    started = []
+    cancelled = []
+
+    async def work(arg):
+        started.append(arg)
+        if arg == 0:
+            raise ValueError("boom")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(arg)
+            raise
+
+    with pytest.raises(ValueError, match="boom"):
+        async for _ in _boundedMap(work, range(5), 2):
+            pass
+    await asyncio.sleep(0)
+    assert started == [0, 1]
+    assert cancelled == [1]
+
+
+@pytest.mark.asyncio
+async def test_process_sources_cancels_running_sources_when_progress_fails(
+    tmp_path, monkeypatch
+):
+    # Run all three sources at once, whatever the machine
+    monkeypatch.setattr(os, "cpu_count", lambda: 3)
+    designspace_path = _write_designspace(tmp_path, {400: "", 600: "", 900: ""})
+    cancelled = []
+
+    async def runInProcess(func, ufo_path):
+        try:
+            await asyncio.sleep(0 if ufo_path.endswith("M400.ufo") else 1)
+        except asyncio.CancelledError:
+            cancelled.append(ufo_path)
+            raise
+        return True
+
+    async def progress_callback(fraction, message):
+        raise RuntimeError("progress failed")
+
+    async with FeamergeBackend(designspace_path) as backend:
+        backend._runInProcess = runInProcess
+        with pytest.raises(RuntimeError, match="progress failed"):
+            await backend._processSources(
+                _breakKerningGroupsInSource, "Expanded", progress_callback
+            )
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == [
+            str(tmp_path / "M600.ufo"),
+            str(tmp_path / "M900.ufo"),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_process_all_runs_sources_in_worker_processes(tmp_path):
+    designspace_path = _write_designspace(
+        tmp_path,
+        {
+            400: "@L = [A B];\npos @L C -5;\npos \\A \\C -5;\n",
+            900: "@L = [A B];\npos @L C -9;\npos \\A \\C -9;\n",
+        },
+    )
+
+    async with FeamergeBackend(designspace_path) as backend:
+        result = await backend.processAll()
+
+    assert result["status"] == "success", result
+    assert sorted(result["results"]["groups"]["processed"]) == [
+        "M400.ufo",
+        "M900.ufo",
+    ]
+    expanded = (tmp_path / "M900.ufo" / "features_expanded.fea").read_text()
+    assert "pos A C -9;\npos B C -9;\n" in expanded
+    merged = (tmp_path / "variable_features.fea").read_text()
+    assert "pos \\A \\C (Weight=400.0:-5 Weight=900.0:-9);" in merged
+
+
+@pytest.mark.asyncio
+async def test_break_groups_reports_skipped_sources(tmp_path):
+    designspace_path = _write_designspace(
+        tmp_path, {400: "@L = [A B];\npos @L C -5;\n", 900: ""}
+    )
+    (tmp_path / "M900.ufo" / "features.fea").unlink()
+    with zipfile.ZipFile(tmp_path / "M700.ufoz", "w") as z:
+        z.writestr("M700.ufo/features.fea", "pos a b -5;\n")
+    doc = DesignSpaceDocument.fromfile(designspace_path)
+    doc.addSourceDescriptor(filename="M700.ufoz", location={"Weight": 700})
+    doc.write(designspace_path)
+
+    async with FeamergeBackend(designspace_path) as backend:
+        result = await backend.breakKerningGroups()
+
+    assert result["status"] == "success", result
+    assert result["processed"] == ["M400.ufo"]
+    assert sorted(result["skipped"]) == ["M700.ufoz", "M900.ufo"]
+    assert result["message"].startswith("Kerning groups expanded in 1 sources")
@@ -0,0 +1,96 @@
+import subprocess
+import sys
+
+from fontra_feamerge.break_groups_in_fea import expand_kerning_groups, parse_groups
+from fontra_feamerge.break_groups_in_mark_pos import expand_groups_in_line
+from fontra_feamerge.expand_groups import expand_all_groups
+from fontra_feamerge.fea_document import expand_side, tokenize_side
+
+FEA = """@L = [A B];
+@R = [C
+  D];
+feature kern {
+pos @L @R -50;
+pos [@L] y 10;
+pos mark @L @R anchor 0 400;
+} kern;"""
+
+
+def test_parse_groups():
+    assert parse_groups(FEA) == {"L": ("A", "B"), "R": ("C", "D")}
+
+
+def test_parse_groups_ignores_non_class_statements():
+    assert parse_groups("@A.sc = [a];\nsub a by b;\n@B = x [b];") == {}
+
+
+def test_expand_side():
+    groups = parse_groups(FEA)
+    assert tokenize_side("[@L x]") == ((True, "L"), (False, "x"))
+    assert expand_side("@L", groups) == ("A", "B")
+    assert expand_side("[@L x @Z]", groups) == ["A", "B", "x", "@Z"]
+    assert expand_side("@Z", groups) == ("@Z",)
+    assert expand_side("x", groups) == ("x",)
+    assert expand_side("[x y]", groups) == ["x", "y"]
+
+
+def test_expand_kerning_groups():
+    expanded = expand_kerning_groups(FEA, parse_groups(FEA)).splitlines()
+    assert expanded[4:10] == [
+        "pos A C -50;",
+        "pos A D -50;",
+        "pos B C -50;",
+        "pos B D -50;",
+        "pos A y 10;",
+        "pos B y 10;",
+    ]
+    assert expanded[10] == "pos mark @L @R anchor 0 400;"
+
+
+def test_expand_groups_in_line():
+    groups = parse_groups(FEA)
+    assert expand_groups_in_line("pos mark @L [@R] anchor 0 400;", groups) == [
+        "pos mark A C anchor 0 400;",
+        "pos mark A D anchor 0 400;",
+        "pos mark B C anchor 0 400;",
+        "pos mark B D anchor 0 400;",
+    ]
+    assert expand_groups_in_line("pos @L @R -50;", groups) == ["pos @L @R -50;"]
+
+
+def test_expand_all_groups():
+    expanded = expand_all_groups(FEA, parse_groups(FEA)).splitlines()
+    assert (
+        expanded[4:10]
+        == expand_kerning_groups(FEA, parse_groups(FEA)).splitlines()[4:10]
+    )
+    assert expanded[10:14] == [
+        "pos mark A C anchor 0 400;",
+        "pos mark A D anchor 0 400;",
+        "pos mark B C anchor 0 400;",
+        "pos mark B D anchor 0 400;",
+    ]
+    assert expanded[14] == "} kern;"
+
+
+def test_expand_all_groups_keeps_line_endings():
+    fea = "@L = [A B];\r\n  pos @L x -5;\r\n@Q = [ ];\r\npos @Q x 1;\r\n"
+    assert expand_all_groups(fea, parse_groups(fea)) == (
+        "@L = [A B];\r\npos A x -5;\r\npos B x -5;\r\n@Q = [ ];\r\n"
+    )
+
+
+def test_command_line_runs_without_warnings(tmp_path):
+    ufo = tmp_path / "Font.ufo"
+    ufo.mkdir()
+    (ufo / "features.fea").write_text(FEA + "\n")
+    for command in ("break-kerning", "break-mark"):
+        subprocess.run(
+            [sys.executable, "-W", "error", "-m", "fontra_feamerge", command, ufo],
+            check=True,
+            capture_output=True,
+        )
+    expanded = (ufo / "features_expanded.fea").read_text().splitlines()
+    assert expanded[4] == "pos A C -50;"
+    expanded_mark = (ufo / "features_expanded_mark.fea").read_text().splitlines()
+    assert "pos mark A C anchor 0 400;" in expanded_mark
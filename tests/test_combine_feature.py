@@ -0,0 +1,195 @@
+import os
+import zipfile
+
+import pytest
+from fontTools.designspaceLib import DesignSpaceDocument
+
+from fontra_feamerge import combine_feature
+from fontra_feamerge.combine_feature import (
+    VariableFeatureCombiner,
+    _iter_lookup_blocks,
+    _read_ufo_features,
+)
+
+
+def test_iter_lookup_blocks():
+    text = """lookup kernA {
+  pos a b -5;
+} kernA;
+feature mark {
+  lookup markA {
+    # not a block end }
+    markClass [\\acute ] <anchor 0 500> @top;
+  } markA;
+  lookup kernA;
+} mark;
+lookup broken {
+  pos a b 5;
+} other;"""
+    blocks = list(_iter_lookup_blocks(text))
+    assert [name for name, _ in blocks] == ["kernA", "markA"]
+    assert "markClass" in blocks[1][1]
+
+
+def test_read_ufo_features(tmp_path):
+    ufo = tmp_path / "Font.ufo"
+    ufo.mkdir()
+    (ufo / "features.fea").write_text("@X = [a];\n", encoding="utf-8")
+    assert _read_ufo_features(str(ufo)) == "@X = [a];\n"
+
+    ufoz = tmp_path / "Font.ufoz"
+    with zipfile.ZipFile(ufoz, "w") as z:
+        z.writestr("Font.ufo/glyphs/features.fea", "not this one")
+        z.writestr("Font.ufo/features.fea", "@X = [a];\r\n")
+    assert _read_ufo_features(str(ufoz)) == "@X = [a];\n"
+
+    empty = tmp_path / "Empty.ufo"
+    empty.mkdir()
+    assert _read_ufo_features(str(empty)) == ""
+
+
+def _write_designspace(tmp_path, features_by_weight):
+    doc = DesignSpaceDocument()
+    doc.addAxisDescriptor(
+        name="Weight", tag="wght", minimum=400, default=400, maximum=900
+    )
+    for weight, features in features_by_weight.items():
+        ufo = tmp_path / f"M{weight}.ufo"
+        ufo.mkdir()
+        (ufo / "features.fea").write_text(features)
+        doc.addSourceDescriptor(filename=ufo.name, location={"Weight": weight})
+    doc.write(tmp_path / "T.designspace")
+    return str(tmp_path / "T.designspace")
+
+
+def test_prepare_features_reparses_changed_masters(tmp_path, monkeypatch):
+    designspace_path = _write_designspace(
+        tmp_path, {400: "pos \\A \\B -4;\n", 900: "pos \\A \\B -9;\n"}
+    )
+
+    parsed = []
+    parse_master = combine_feature._parse_master
+    monkeypatch.setattr(
+        combine_feature,
+        "_parse_master",
+        lambda text: parsed.append(text) or parse_master(text),
+    )
+    combiner = VariableFeatureCombiner(designspace_path)
+    combiner.prepare_features()
+    combiner.prepare_features()
+    assert len(parsed) == 2
+
+    fea_path = tmp_path / "M900.ufo" / "features.fea"
+    fea_path.write_text("pos \\A \\B -20;\n")
+    os.utime(fea_path, ns=(0, 0))
+    combiner.prepare_features()
+    assert len(parsed) == 3
+    assert combiner.format_variable_positioning(combiner.kern_pairs["A", "B"]) == (
+        "Weight=400.0:-4 Weight=900.0:-20"
+    )
+
+
+def test_generate_variable_features_skips_zero_pairs(tmp_path):
+    designspace_path = _write_designspace(
+        tmp_path,
+        {
+            400: "pos \\A \\B 0;\npos \\A \\C 0;\n",
+            900: "pos \\A \\B 0;\npos \\A \\C 5;\n",
+        },
+    )
+    combiner = VariableFeatureCombiner(designspace_path)
+    combiner.prepare_features()
+    lines = combiner.generate_variable_features().splitlines()
+    assert [line for line in lines if line.startswith("    pos")] == [
+        "    pos \\A \\C (Weight=400.0:0 Weight=900.0:5);"
+    ]
+
+
+MASTER_FEA = """\
+@L = [\\A \\B];
+feature kern {
+pos \\A \\B %d;
+pos \\A \\C 0;
+pos \\B \\C -5;
+} kern;
+lookup markLook {
+  markClass [\\acute ] <anchor 100 %d> @top;
+  pos base [\\A ] <anchor 200 700> mark @top;
+} markLook;
+table GDEF {
+  GlyphClassDef [A], , , ;
+} GDEF;
+"""
+
+
+def _prepared_combiner(tmp_path):
+    designspace_path = _write_designspace(
+        tmp_path, {400: MASTER_FEA % (-10, 400), 900: MASTER_FEA % (-30, 450)}
+    )
+    combiner = VariableFeatureCombiner(designspace_path)
+    combiner.prepare_features()
+    return combiner
+
+
+def test_generate_variable_features_golden(tmp_path):
+    combiner = _prepared_combiner(tmp_path)
+    assert combiner.generate_variable_features() == (r"""languagesystem DFLT dflt;
+languagesystem latn dflt;
+
+# Variable features.fea generated from designspace masters
+
+@L = [\A \B];
+
+feature kern {
+    pos \A \B (Weight=400.0:-10 Weight=900.0:-30);
+    pos \B \C (Weight=400.0:-5 Weight=900.0:-5);
+} kern;
+
+lookup markLook {
+  lookupflag 0;
+  markClass [\\acute ] <anchor Weight=400.0:100 Weight=900.0:100 Weight=400.0:400 Weight=900.0:450> @top;
+  pos base [\\A ] <anchor Weight=400.0:200 Weight=900.0:200 Weight=400.0:700 Weight=900.0:700> mark @top;
+} markLook;
+
+feature mark {
+    script DFLT;
+    language dflt ;
+    lookup markLook;
+    script latn;
+    language dflt ;
+    lookup markLook;
+} mark;
+
+table GDEF {
+  GlyphClassDef [A], , , ;
+} GDEF;
+""")
+
+
+@pytest.mark.parametrize("chunk_lines", [1, 2, 3, 1000])
+def test_iter_combined_chunks_matches_generated_text(tmp_path, chunk_lines):
+    combiner = _prepared_combiner(tmp_path)
+    expected = combiner.generate_variable_features()
+    assert "".join(combiner.iter_combined_chunks(chunk_lines)) == expected
+    assert combiner.count_feature_lines() == len(list(combiner.iter_feature_lines()))
+
+
+@pytest.mark.asyncio
+async def test_save_combined_features_async_matches_sync(tmp_path):
+    combiner = _prepared_combiner(tmp_path)
+    sync_path = tmp_path / "sync.fea"
+    async_path = tmp_path / "async.fea"
+    combiner.save_combined_features(str(sync_path))
+
+    progress = []
+
+    async def progress_callback(fraction, message):
+        progress.append(fraction)
+
+    await combiner.save_combined_features_async(
+        str(async_path), progress_callback, chunk_lines=4
+    )
+    assert async_path.read_text() == sync_path.read_text()
+    assert progress == sorted(progress)
+    assert progress[-1] == 1.0
+    assert len(progress) == -(-combiner.count_feature_lines() // 4)